@@ -11,59 +11,161 @@ License: MIT
 import uno
 import unohelper
 import threading
-import time
+import queue
+from concurrent.futures import ThreadPoolExecutor
 import ctypes
-import ctypes.wintypes
 import traceback
 import os
-import json
+import sys
+import types
 
 from com.sun.star.task import XJobExecutor
 from com.sun.star.lang import XServiceInfo
+from com.sun.star.lang import DisposedException
+
+# Use orjson for settings when it's installed, stdlib json otherwise.
+try:
+    import orjson as _json
+
+    def _dumps(obj):
+        return _json.dumps(obj, option=_json.OPT_INDENT_2)
+except ImportError:
+    import json as _json
+
+    def _dumps(obj):
+        return _json.dumps(obj, indent=2).encode("utf-8")
+
+_loads = _json.loads
 
 # Windows Clipboard API via ctypes
 
 CF_UNICODETEXT = 13
 
+# Win32 types, sized directly rather than through ctypes.wintypes.
+BOOL = ctypes.c_int
+UINT = ctypes.c_uint32
+DWORD = ctypes.c_uint32
+ATOM = ctypes.c_uint16
+HANDLE = ctypes.c_void_p
+HWND = ctypes.c_void_p
+LPCWSTR = ctypes.c_wchar_p
+WPARAM = ctypes.c_size_t
+LPARAM = ctypes.c_ssize_t
+LRESULT = ctypes.c_ssize_t
+
 user32 = ctypes.windll.user32
 kernel32 = ctypes.windll.kernel32
 
-OpenClipboard = user32.OpenClipboard
-OpenClipboard.argtypes = [ctypes.wintypes.HWND]
-OpenClipboard.restype = ctypes.wintypes.BOOL
 
-CloseClipboard = user32.CloseClipboard
-CloseClipboard.argtypes = []
-CloseClipboard.restype = ctypes.wintypes.BOOL
+def _winapi(dll, name, restype, *argtypes):
+    """Bind a __stdcall export through an explicit WINFUNCTYPE prototype."""
+    return ctypes.WINFUNCTYPE(restype, *argtypes)((name, dll))
+
+
+OpenClipboard = _winapi(user32, "OpenClipboard", BOOL, HWND)
+CloseClipboard = _winapi(user32, "CloseClipboard", BOOL)
+GetClipboardData = _winapi(user32, "GetClipboardData", HANDLE, UINT)
+GetClipboardSequenceNumber = _winapi(user32, "GetClipboardSequenceNumber", DWORD)
+IsClipboardFormatAvailable = _winapi(user32, "IsClipboardFormatAvailable", BOOL, UINT)
+GetClipboardOwner = _winapi(user32, "GetClipboardOwner", HWND)
+GetWindowThreadProcessId = _winapi(
+    user32, "GetWindowThreadProcessId", DWORD, HWND, ctypes.POINTER(DWORD)
+)
+
+GlobalLock = _winapi(kernel32, "GlobalLock", ctypes.c_void_p, HANDLE)
+GlobalUnlock = _winapi(kernel32, "GlobalUnlock", BOOL, HANDLE)
+GlobalSize = _winapi(kernel32, "GlobalSize", ctypes.c_size_t, HANDLE)
+
+msvcrt = ctypes.cdll.msvcrt
+wcsnlen = ctypes.CFUNCTYPE(ctypes.c_size_t, ctypes.c_void_p, ctypes.c_size_t)(
+    ("wcsnlen", msvcrt)
+)
 
-GetClipboardData = user32.GetClipboardData
-GetClipboardData.argtypes = [ctypes.wintypes.UINT]
-GetClipboardData.restype = ctypes.wintypes.HANDLE
+# Message-only window for WM_CLIPBOARDUPDATE notifications
 
-GetClipboardSequenceNumber = user32.GetClipboardSequenceNumber
-GetClipboardSequenceNumber.argtypes = []
-GetClipboardSequenceNumber.restype = ctypes.wintypes.DWORD
+WM_QUIT = 0x0012
+WM_CLIPBOARDUPDATE = 0x031D
+HWND_MESSAGE = HWND(-3)
+LISTENER_CLASS_NAME = "DragonBridgeClipboardListener"
 
-GlobalLock = kernel32.GlobalLock
-GlobalLock.argtypes = [ctypes.wintypes.HANDLE]
-GlobalLock.restype = ctypes.c_void_p
+WNDPROC = ctypes.WINFUNCTYPE(LRESULT, HWND, UINT, WPARAM, LPARAM)
 
-GlobalUnlock = kernel32.GlobalUnlock
-GlobalUnlock.argtypes = [ctypes.wintypes.HANDLE]
-GlobalUnlock.restype = ctypes.wintypes.BOOL
+
+class WNDCLASSW(ctypes.Structure):
+    _fields_ = [
+        ("style", UINT),
+        ("lpfnWndProc", WNDPROC),
+        ("cbClsExtra", ctypes.c_int),
+        ("cbWndExtra", ctypes.c_int),
+        ("hInstance", HANDLE),
+        ("hIcon", HANDLE),
+        ("hCursor", HANDLE),
+        ("hbrBackground", HANDLE),
+        ("lpszMenuName", LPCWSTR),
+        ("lpszClassName", LPCWSTR),
+    ]
+
+
+class POINT(ctypes.Structure):
+    _fields_ = [("x", ctypes.c_long), ("y", ctypes.c_long)]
+
+
+class MSG(ctypes.Structure):
+    _fields_ = [
+        ("hwnd", HWND),
+        ("message", UINT),
+        ("wParam", WPARAM),
+        ("lParam", LPARAM),
+        ("time", DWORD),
+        ("pt", POINT),
+    ]
+
+
+GetModuleHandleW = _winapi(kernel32, "GetModuleHandleW", HANDLE, LPCWSTR)
+GetCurrentThreadId = _winapi(kernel32, "GetCurrentThreadId", DWORD)
+
+RegisterClassW = _winapi(user32, "RegisterClassW", ATOM, ctypes.POINTER(WNDCLASSW))
+UnregisterClassW = _winapi(user32, "UnregisterClassW", BOOL, LPCWSTR, HANDLE)
+CreateWindowExW = _winapi(
+    user32, "CreateWindowExW", HWND,
+    DWORD, LPCWSTR, LPCWSTR, DWORD,
+    ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+    HWND, HANDLE, HANDLE, ctypes.c_void_p,
+)
+DestroyWindow = _winapi(user32, "DestroyWindow", BOOL, HWND)
+DefWindowProcW = _winapi(user32, "DefWindowProcW", LRESULT, HWND, UINT, WPARAM, LPARAM)
+
+AddClipboardFormatListener = _winapi(user32, "AddClipboardFormatListener", BOOL, HWND)
+RemoveClipboardFormatListener = _winapi(
+    user32, "RemoveClipboardFormatListener", BOOL, HWND
+)
+
+GetMessageW = _winapi(user32, "GetMessageW", BOOL, ctypes.POINTER(MSG), HWND, UINT, UINT)
+TranslateMessage = _winapi(user32, "TranslateMessage", BOOL, ctypes.POINTER(MSG))
+DispatchMessageW = _winapi(user32, "DispatchMessageW", LRESULT, ctypes.POINTER(MSG))
+PostThreadMessageW = _winapi(
+    user32, "PostThreadMessageW", BOOL, DWORD, UINT, WPARAM, LPARAM
+)
 
 
 def get_clipboard_text():
     """Read current clipboard text using Windows API."""
     text = ""
-    if OpenClipboard(0):
+    if IsClipboardFormatAvailable(CF_UNICODETEXT) and OpenClipboard(0):
         try:
             handle = GetClipboardData(CF_UNICODETEXT)
             if handle:
                 ptr = GlobalLock(handle)
                 if ptr:
                     try:
-                        text = ctypes.wstring_at(ptr)
+                        # The block may be padded past the text, so find the
+                        # terminator, but never scan beyond the allocation.
+                        size = GlobalSize(handle)
+                        if size:
+                            nchars = wcsnlen(ptr, size // ctypes.sizeof(ctypes.c_wchar))
+                            text = ctypes.wstring_at(ptr, nchars)
+                        else:
+                            text = ctypes.wstring_at(ptr)
                     finally:
                         GlobalUnlock(handle)
         finally:
@@ -76,39 +178,87 @@ def get_clipboard_seq():
     return GetClipboardSequenceNumber()
 
 
+_OWN_PID = os.getpid()
+
+
+def clipboard_owned_by_us():
+    """Check whether the clipboard was last set by this (LibreOffice) process."""
+    hwnd = GetClipboardOwner()
+    if not hwnd:
+        return False
+    pid = DWORD()
+    GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+    return pid.value == _OWN_PID
+
+
 # Configuration
 
+_CONFIG_PATH = None
+
+
 def get_config_path():
-    """Get path for storing settings."""
-    profile = os.environ.get("APPDATA", os.path.expanduser("~"))
-    config_dir = os.path.join(profile, "DragonBridge")
-    os.makedirs(config_dir, exist_ok=True)
-    return os.path.join(config_dir, "settings.json")
+    """Get path for storing settings, creating its directory on first use."""
+    global _CONFIG_PATH
+    if _CONFIG_PATH is None:
+        profile = os.environ.get("APPDATA", os.path.expanduser("~"))
+        config_dir = os.path.join(profile, "DragonBridge")
+        os.makedirs(config_dir, exist_ok=True)
+        _CONFIG_PATH = os.path.join(config_dir, "settings.json")
+    return _CONFIG_PATH
+
+
+# Last loaded settings and the settings.json mtime they were read at.
+_config_cache = None
+_config_mtime = None
+
+
+def _config_file_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
 
 
 def load_config():
-    """Load settings from disk."""
-    defaults = {
-        "poll_interval_ms": 300,
-        "auto_space": True,
-        "show_notifications": True,
-    }
+    """
+    Load settings from disk. The file is only re-parsed when its mtime
+    changes; callers always get their own copy of the settings dict.
+    """
+    global _config_cache, _config_mtime
     try:
         path = get_config_path()
-        if os.path.exists(path):
-            with open(path, "r") as f:
-                saved = json.load(f)
-            defaults.update(saved)
+        mtime = _config_file_mtime(path)
     except Exception:
-        pass
-    return defaults
+        path = mtime = None
+    if _config_cache is None or mtime != _config_mtime:
+        defaults = {
+            "poll_interval_ms": 300,
+            "auto_space": True,
+            "show_notifications": True,
+        }
+        try:
+            if mtime is not None:
+                with open(path, "rb") as f:
+                    saved = _loads(f.read())
+                defaults.update(saved)
+        except Exception:
+            pass
+        _config_cache = defaults
+        _config_mtime = mtime
+    return dict(_config_cache)
 
 
 def save_config(config):
     """Save settings to disk."""
+    global _config_mtime
+    if _config_cache is not None:
+        _config_cache.clear()
+        _config_cache.update(config)
     try:
-        with open(get_config_path(), "w") as f:
-            json.dump(config, f, indent=2)
+        path = get_config_path()
+        with open(path, "wb") as f:
+            f.write(_dumps(config))
+        _config_mtime = _config_file_mtime(path)
     except Exception:
         pass
 
@@ -152,24 +302,37 @@ ACTION_COMMANDS = {
     "scratch that": ".uno:Undo",
 }
 
+# Single read-only phrase -> (type, result) table with interned keys;
+# action commands win on overlap.
+_ALL_COMMANDS = {sys.intern(k): ("text", v) for k, v in VOICE_COMMANDS.items()}
+_ALL_COMMANDS.update(
+    (sys.intern(k), ("action", v)) for k, v in ACTION_COMMANDS.items()
+)
+_ALL_COMMANDS = types.MappingProxyType(_ALL_COMMANDS)
+
+# Anything outside this length range (plus slack for surrounding
+# whitespace) can't be a command, so it skips normalization entirely.
+_CMD_LEN_MIN = min(len(k) for k in _ALL_COMMANDS)
+_CMD_LEN_MAX = max(len(k) for k in _ALL_COMMANDS)
+_CMD_LEN_SLACK = 4
+
 
 def process_voice_commands(text):
     """
     Check if text matches a known Dragon voice command.
     Returns (type, result) where type is 'action', 'text', or 'insert'.
     """
-    lower = text.strip().lower()
+    n = len(text)
+    if n < _CMD_LEN_MIN or n > _CMD_LEN_MAX + _CMD_LEN_SLACK:
+        return ("insert", text)
 
-    if lower in ACTION_COMMANDS:
-        return ("action", ACTION_COMMANDS[lower])
+    return _ALL_COMMANDS.get(text.strip().lower(), ("insert", text))
 
-    if lower in VOICE_COMMANDS:
-        return ("text", VOICE_COMMANDS[lower])
 
-    return ("insert", text)
+# Clipboard Bridge
 
+COALESCE_SEC = 0.02
 
-# Clipboard Bridge
 
 class ClipboardBridge:
     """
@@ -181,6 +344,21 @@ class ClipboardBridge:
         self.ctx = ctx
         self.running = False
         self.thread = None
+        self._worker = None
+        self._exec = None
+        self._thread_id = None
+        self._stop_event = threading.Event()
+        self._listener_ready = threading.Event()
+        self._q = queue.Queue()
+        # Items queued, waiting in the drain loop, or submitted but not done.
+        self._in_flight = 0
+        self._in_flight_lock = threading.Lock()
+        self._wndproc = WNDPROC(self._wnd_proc)
+        self._desktop = None
+        self._dispatch_helper = None
+        self._url_transformer = None
+        self._command_urls = {}
+        self._dispatchers = {}
         self.config = load_config()
         self.last_seq = get_clipboard_seq()
         self.last_text = get_clipboard_text()
@@ -188,62 +366,250 @@ class ClipboardBridge:
     def start(self):
         if self.running:
             return
+        try:
+            self._get_desktop()
+            self._get_dispatch_helper()
+            for cmd_url in set(ACTION_COMMANDS.values()):
+                self._get_command_url(cmd_url)
+        except Exception:
+            traceback.print_exc()
+            self._notify("Clipboard monitoring could not be started.")
+            return
         self.running = True
-        self.last_seq = get_clipboard_seq()
-        self.last_text = get_clipboard_text()
+        self._stop_event.clear()
+        self._listener_ready.clear()
+        if self.last_seq is None:
+            # Restarting after stop() - don't replay what was copied meanwhile.
+            self.last_seq = get_clipboard_seq()
+            self.last_text = get_clipboard_text()
+        self._exec = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="DragonBridgeInsert"
+        )
+        self._worker = threading.Thread(
+            target=self._drain_loop, args=(self._exec,), daemon=True
+        )
+        self._worker.start()
         self.thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.thread.start()
         self._notify("Clipboard monitoring started - dictate into DragonPad and transfer.")
 
     def stop(self):
         self.running = False
+        self._stop_event.set()
         if self.thread:
+            # The listener may still be setting up its window; wait until its
+            # thread id is published (or it gave up) so WM_QUIT isn't missed.
+            self._listener_ready.wait(timeout=2)
+            thread_id = self._thread_id
+            if thread_id:
+                PostThreadMessageW(thread_id, WM_QUIT, 0, 0)
             self.thread.join(timeout=2)
             self.thread = None
+        if self._worker:
+            self._q.put(None)
+            self._worker.join(timeout=2)
+            self._worker = None
+        if self._exec:
+            # Don't block on an in-flight UNO call; queued bursts still run.
+            self._exec.shutdown(wait=False)
+            self._exec = None
         self._notify("Clipboard monitoring stopped.")
+        self.last_seq = None
+        self._desktop = None
+        self._dispatch_helper = None
+        self._url_transformer = None
+        self._command_urls.clear()
+        self._dispatchers.clear()
 
     def is_running(self):
         return self.running
 
     def _monitor_loop(self):
-        """Main polling loop - checks clipboard for changes."""
-        poll_sec = self.config.get("poll_interval_ms", 300) / 1000.0
+        """Watch the clipboard, falling back to polling if the listener can't register."""
+        try:
+            if self._listen_loop():
+                return
+        except Exception:
+            traceback.print_exc()
+        finally:
+            self._listener_ready.set()
+        self._poll_loop()
+
+    def _listen_loop(self):
+        """
+        Event-driven loop - blocks on GetMessageW for WM_CLIPBOARDUPDATE.
+        Returns False if the listener window could not be set up.
+        """
+        hinstance = GetModuleHandleW(None)
+        wndclass = WNDCLASSW()
+        wndclass.lpfnWndProc = self._wndproc
+        wndclass.hInstance = hinstance
+        wndclass.lpszClassName = LISTENER_CLASS_NAME
+        if not RegisterClassW(ctypes.byref(wndclass)):
+            return False
+
+        hwnd = None
+        try:
+            hwnd = CreateWindowExW(
+                0, LISTENER_CLASS_NAME, LISTENER_CLASS_NAME, 0,
+                0, 0, 0, 0, HWND_MESSAGE, None, hinstance, None,
+            )
+            if not hwnd or not AddClipboardFormatListener(hwnd):
+                return False
 
-        while self.running:
             try:
-                current_seq = get_clipboard_seq()
-                if current_seq != self.last_seq:
-                    self.last_seq = current_seq
-                    current_text = get_clipboard_text()
+                self._thread_id = GetCurrentThreadId()
+                self._listener_ready.set()
+                # stop() may have run before the thread id was published.
+                if not self.running:
+                    return True
+                msg = MSG()
+                while self.running and GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                    TranslateMessage(ctypes.byref(msg))
+                    DispatchMessageW(ctypes.byref(msg))
+            finally:
+                self._thread_id = None
+                RemoveClipboardFormatListener(hwnd)
+            return True
+        finally:
+            if hwnd:
+                DestroyWindow(hwnd)
+            UnregisterClassW(LISTENER_CLASS_NAME, hinstance)
+
+    def _wnd_proc(self, hwnd, msg, wparam, lparam):
+        """Window procedure for the message-only listener window."""
+        if msg == WM_CLIPBOARDUPDATE:
+            try:
+                self._on_clipboard_update()
+            except Exception:
+                traceback.print_exc()
+            return 0
+        return DefWindowProcW(hwnd, msg, wparam, lparam)
 
-                    if current_text and current_text != self.last_text:
-                        self.last_text = current_text
-                        self._process_clipboard_text(current_text)
+    def _poll_loop(self):
+        """Fallback polling loop - checks clipboard for changes."""
+        poll_sec = self.config.get("poll_interval_ms", 300) / 1000.0
+        # Local names keep globals/attribute lookups out of the loop.
+        _gcs = GetClipboardSequenceNumber
+        _wait = self._stop_event.wait
+        _last = self.last_seq
 
+        # wait() returns True as soon as stop() sets the event.
+        while not _wait(poll_sec):
+            try:
+                if _gcs() != _last:
+                    self._on_clipboard_update()
+                    _last = self.last_seq
             except Exception:
                 traceback.print_exc()
 
-            time.sleep(poll_sec)
+    def _on_clipboard_update(self):
+        """Read the changed clipboard and queue new text for the worker."""
+        self.last_seq = get_clipboard_seq()
+        # Skip our own copies (e.g. "copy that") so they aren't re-inserted.
+        if clipboard_owned_by_us():
+            return
+        current_text = get_clipboard_text()
+
+        if current_text and current_text != self.last_text:
+            self.last_text = current_text
+            with self._in_flight_lock:
+                self._in_flight += 1
+            self._q.put((self.last_seq, current_text))
+
+    def _drain_loop(self, executor):
+        """
+        Worker loop - collects queued clipboard text until stopped.
+        Items arriving within COALESCE_SEC of each other are handed to the
+        executor as one burst so consecutive text goes in with a single insert.
+        """
+        done = False
+        while not done:
+            burst = [self._q.get()]
+            try:
+                while burst[-1] is not None:
+                    burst.append(self._q.get(timeout=COALESCE_SEC))
+            except queue.Empty:
+                pass
 
-    def _process_clipboard_text(self, text):
-        """Process text from clipboard - check for commands or insert."""
-        cmd_type, result = process_voice_commands(text)
+            if burst[-1] is None:
+                burst.pop()
+                done = True
 
-        if cmd_type == "action":
-            self._dispatch_uno_command(result)
-        elif cmd_type == "text":
-            self._insert_text(result)
-        else:
-            self._insert_text(text)
+            if burst:
+                executor.submit(self._process_burst, burst)
 
-    def _get_active_document(self):
-        """Get the active Writer document and its text cursor."""
+    def _process_burst(self, burst):
+        """Process (seq, text) items - join runs of text, dispatch actions in order."""
         try:
-            smgr = self.ctx.ServiceManager
-            desktop = smgr.createInstanceWithContext(
+            pending = []
+            for i, (_seq, text) in enumerate(burst):
+                cmd_type, result = process_voice_commands(text)
+
+                if cmd_type == "action":
+                    self._insert_text_batch(pending)
+                    pending = []
+                    # Only fire-and-forget when nothing anywhere in the
+                    # pipeline (this burst, _q, the drain loop or the
+                    # executor) still has to run after it.
+                    with self._in_flight_lock:
+                        follows = self._in_flight > len(burst)
+                    follows = follows or i + 1 < len(burst)
+                    self._dispatch_uno_command(result, wait=follows)
+                else:
+                    pending.append(result)
+
+            self._insert_text_batch(pending)
+        except Exception:
+            traceback.print_exc()
+        finally:
+            with self._in_flight_lock:
+                self._in_flight -= len(burst)
+
+    def _get_desktop(self):
+        """Return the cached Desktop service, creating it if needed."""
+        if self._desktop is None:
+            self._desktop = self.ctx.ServiceManager.createInstanceWithContext(
                 "com.sun.star.frame.Desktop", self.ctx
             )
-            doc = desktop.getCurrentComponent()
+        return self._desktop
+
+    def _get_dispatch_helper(self):
+        """Return the cached DispatchHelper service, creating it if needed."""
+        if self._dispatch_helper is None:
+            self._dispatch_helper = self.ctx.ServiceManager.createInstanceWithContext(
+                "com.sun.star.frame.DispatchHelper", self.ctx
+            )
+        return self._dispatch_helper
+
+    def _get_url_transformer(self):
+        """Return the cached URLTransformer service, creating it if needed."""
+        if self._url_transformer is None:
+            self._url_transformer = self.ctx.ServiceManager.createInstanceWithContext(
+                "com.sun.star.util.URLTransformer", self.ctx
+            )
+        return self._url_transformer
+
+    def _current_component(self):
+        """Get the Desktop's current component, re-creating a disposed Desktop."""
+        try:
+            return self._get_desktop().getCurrentComponent()
+        except DisposedException:
+            self._desktop = None
+            return self._get_desktop().getCurrentComponent()
+
+    def _current_frame(self):
+        """Get the Desktop's current frame, re-creating a disposed Desktop."""
+        try:
+            return self._get_desktop().getCurrentFrame()
+        except DisposedException:
+            self._desktop = None
+            return self._get_desktop().getCurrentFrame()
+
+    def _get_active_document(self):
+        """Get the active Writer document and its text cursor."""
+        try:
+            doc = self._current_component()
             if doc and doc.supportsService("com.sun.star.text.TextDocument"):
                 controller = doc.getCurrentController()
                 view_cursor = controller.getViewCursor()
@@ -253,48 +619,103 @@ class ClipboardBridge:
             traceback.print_exc()
         return None, None, None
 
-    def _insert_text(self, text):
-        """Insert text at the current cursor position in the active document."""
+    def _insert_text_batch(self, texts):
+        """
+        Insert several pieces of text at the current cursor position in the
+        active document with one insertString call. Controllers and actions
+        are locked meanwhile so Writer lays the view out once.
+        """
+        if not texts:
+            return
         try:
             doc, doc_text, view_cursor = self._get_active_document()
             if doc_text and view_cursor:
-                text_cursor = doc_text.createTextCursorByRange(
-                    view_cursor.getStart()
-                )
-                if not view_cursor.isCollapsed():
-                    text_cursor = doc_text.createTextCursorByRange(view_cursor)
-                    doc_text.insertString(text_cursor, text, True)
-                else:
-                    doc_text.insertString(text_cursor, text, False)
-
-                view_cursor.gotoEnd(False)
+                text = "".join(texts)
+                doc.lockControllers()
+                action_locked = False
+                try:
+                    # Not every model implements XActionLockable.
+                    if hasattr(doc, "addActionLock"):
+                        doc.addActionLock()
+                        action_locked = True
+
+                    # A selection is replaced; otherwise insert at the caret.
+                    collapsed = view_cursor.isCollapsed()
+                    src = view_cursor.getStart() if collapsed else view_cursor
+                    text_cursor = doc_text.createTextCursorByRange(src)
+                    doc_text.insertString(text_cursor, text, not collapsed)
+
+                    view_cursor.gotoEnd(False)
+                finally:
+                    if action_locked:
+                        doc.removeActionLock()
+                    doc.unlockControllers()
         except Exception:
             traceback.print_exc()
 
-    def _dispatch_uno_command(self, cmd_url):
-        """Execute a UNO dispatch command."""
+    def _get_command_url(self, cmd_url):
+        """Return the parsed com.sun.star.util.URL for a command, cached."""
+        url = self._command_urls.get(cmd_url)
+        if url is None:
+            url = uno.createUnoStruct("com.sun.star.util.URL")
+            url.Complete = cmd_url
+            _, url = self._get_url_transformer().parseStrict(url)
+            self._command_urls[cmd_url] = url
+        return url
+
+    def _get_dispatcher(self, frame, url):
+        """
+        Return the frame's XDispatch for a command, cached per frame and
+        controller - a reloaded document keeps its frame but gets a new
+        controller, and the old controller's dispatcher silently does nothing.
+        """
+        controller = frame.getController()
+        cached = self._dispatchers.get(url.Complete)
+        if cached is not None and cached[0] == frame and cached[1] == controller:
+            return cached[2]
+        xdispatch = frame.queryDispatch(url, "", 0)
+        if xdispatch:
+            self._dispatchers[url.Complete] = (frame, controller, xdispatch)
+        else:
+            self._dispatchers.pop(url.Complete, None)
+        return xdispatch
+
+    def _dispatch_uno_command(self, cmd_url, wait=True):
+        """
+        Execute a UNO dispatch command. With wait=False it goes through the
+        oneway XDispatch.dispatch(), which doesn't wait for Writer to finish
+        and so gives no ordering against later inserts. Otherwise, or when
+        the frame offers no dispatcher, DispatchHelper runs it to completion.
+        """
         try:
-            smgr = self.ctx.ServiceManager
-            desktop = smgr.createInstanceWithContext(
-                "com.sun.star.frame.Desktop", self.ctx
-            )
-            frame = desktop.getCurrentFrame()
+            frame = self._current_frame()
             if frame:
-                dispatch = smgr.createInstanceWithContext(
-                    "com.sun.star.frame.DispatchHelper", self.ctx
-                )
-                dispatch.executeDispatch(frame, cmd_url, "", 0, ())
+                if not wait:
+                    url = self._get_command_url(cmd_url)
+                    try:
+                        xdispatch = self._get_dispatcher(frame, url)
+                        if xdispatch:
+                            xdispatch.dispatch(url, ())
+                            return
+                    except DisposedException:
+                        self._dispatchers.pop(url.Complete, None)
+
+                try:
+                    self._get_dispatch_helper().executeDispatch(
+                        frame, cmd_url, "", 0, ()
+                    )
+                except DisposedException:
+                    self._dispatch_helper = None
+                    self._get_dispatch_helper().executeDispatch(
+                        frame, cmd_url, "", 0, ()
+                    )
         except Exception:
             traceback.print_exc()
 
     def _notify(self, message):
         """Show a notification in the status bar."""
         try:
-            smgr = self.ctx.ServiceManager
-            desktop = smgr.createInstanceWithContext(
-                "com.sun.star.frame.Desktop", self.ctx
-            )
-            doc = desktop.getCurrentComponent()
+            doc = self._current_component()
             if doc:
                 controller = doc.getCurrentController()
                 if controller:
@@ -353,6 +774,9 @@ class SettingsDialog(unohelper.Base, XJobExecutor, XServiceInfo):
     IMPLE_NAME = "org.fjccv.dragonbridge.Settings"
     SERVICE_NAMES = (IMPLE_NAME,)
 
+    # Dialog model reused across opens to skip rebuilding its controls.
+    _cached_model = None
+
     def __init__(self, ctx):
         self.ctx = ctx
 
@@ -366,6 +790,58 @@ class SettingsDialog(unohelper.Base, XJobExecutor, XServiceInfo):
         config = load_config()
         smgr = self.ctx.ServiceManager
 
+        dialog_model = self._get_dialog_model(smgr)
+        dialog_model.getByName("numPoll").Value = config.get("poll_interval_ms", 300)
+        dialog_model.getByName("chkAutoSpace").State = (
+            1 if config.get("auto_space", True) else 0
+        )
+        dialog_model.getByName("chkNotify").State = (
+            1 if config.get("show_notifications", True) else 0
+        )
+
+        # Create and show
+        dialog = smgr.createInstanceWithContext(
+            "com.sun.star.awt.UnoControlDialog", self.ctx
+        )
+        dialog.setModel(dialog_model)
+        toolkit = smgr.createInstanceWithContext(
+            "com.sun.star.awt.Toolkit", self.ctx
+        )
+        dialog.setVisible(False)
+        dialog.createPeer(toolkit, None)
+
+        result = dialog.execute()
+
+        if result == 1:  # OK pressed
+            num_poll = dialog.getControl("numPoll")
+            chk_auto = dialog.getControl("chkAutoSpace")
+            chk_ntfy = dialog.getControl("chkNotify")
+
+            config["poll_interval_ms"] = int(num_poll.getValue())
+            config["auto_space"] = chk_auto.getModel().State == 1
+            config["show_notifications"] = chk_ntfy.getModel().State == 1
+            save_config(config)
+
+            bridge = get_bridge(self.ctx)
+            bridge.config = config
+
+        dialog.dispose()
+
+    def _get_dialog_model(self, smgr):
+        """Return the cached dialog model, rebuilding it if it was disposed."""
+        model = SettingsDialog._cached_model
+        if model is not None:
+            try:
+                model.getByName("numPoll")
+                return model
+            except Exception:
+                pass
+        model = self._build_dialog_model(smgr)
+        SettingsDialog._cached_model = model
+        return model
+
+    def _build_dialog_model(self, smgr):
+        """Build the settings dialog model; values are filled in per open."""
         dialog_model = smgr.createInstanceWithContext(
             "com.sun.star.awt.UnoControlDialogModel", self.ctx
         )
@@ -393,7 +869,6 @@ class SettingsDialog(unohelper.Base, XJobExecutor, XServiceInfo):
         poll_field.PositionY = 13
         poll_field.Width = 60
         poll_field.Height = 14
-        poll_field.Value = config.get("poll_interval_ms", 300)
         poll_field.ValueMin = 100
         poll_field.ValueMax = 2000
         poll_field.DecimalAccuracy = 0
@@ -409,7 +884,6 @@ class SettingsDialog(unohelper.Base, XJobExecutor, XServiceInfo):
         chk_space.Width = 260
         chk_space.Height = 12
         chk_space.Label = "Automatically add space before inserted text"
-        chk_space.State = 1 if config.get("auto_space", True) else 0
         dialog_model.insertByName("chkAutoSpace", chk_space)
 
         # Show notifications checkbox
@@ -422,7 +896,6 @@ class SettingsDialog(unohelper.Base, XJobExecutor, XServiceInfo):
         chk_notify.Width = 260
         chk_notify.Height = 12
         chk_notify.Label = "Show status bar notifications"
-        chk_notify.State = 1 if config.get("show_notifications", True) else 0
         dialog_model.insertByName("chkNotify", chk_notify)
 
         # Info text
@@ -436,8 +909,8 @@ class SettingsDialog(unohelper.Base, XJobExecutor, XServiceInfo):
         lbl_info.Height = 20
         lbl_info.MultiLine = True
         lbl_info.Label = (
-            "Lower poll interval = faster response but more CPU usage. "
-            "300ms is recommended for most systems."
+            "Only used if clipboard change notifications are unavailable. "
+            "Lower = faster response but more CPU usage."
         )
         dialog_model.insertByName("lblSettingsInfo", lbl_info)
 
@@ -467,33 +940,7 @@ class SettingsDialog(unohelper.Base, XJobExecutor, XServiceInfo):
         btn_cancel.PushButtonType = 2
         dialog_model.insertByName("btnCancel", btn_cancel)
 
-        # Create and show
-        dialog = smgr.createInstanceWithContext(
-            "com.sun.star.awt.UnoControlDialog", self.ctx
-        )
-        dialog.setModel(dialog_model)
-        toolkit = smgr.createInstanceWithContext(
-            "com.sun.star.awt.Toolkit", self.ctx
-        )
-        dialog.setVisible(False)
-        dialog.createPeer(toolkit, None)
-
-        result = dialog.execute()
-
-        if result == 1:  # OK pressed
-            num_poll = dialog.getControl("numPoll")
-            chk_auto = dialog.getControl("chkAutoSpace")
-            chk_ntfy = dialog.getControl("chkNotify")
-
-            config["poll_interval_ms"] = int(num_poll.getValue())
-            config["auto_space"] = chk_auto.getModel().State == 1
-            config["show_notifications"] = chk_ntfy.getModel().State == 1
-            save_config(config)
-
-            bridge = get_bridge(self.ctx)
-            bridge.config = config
-
-        dialog.dispose()
+        return dialog_model
 
     def getImplementationName(self):
         return self.IMPLE_NAME